@@ -3,10 +3,12 @@
 import vpdq
 import faiss
 from threatexchange.extensions.vpdq.vpdq_util import VpdqCompactFeature
+from threatexchange.signal_type.pdq.pdq_faiss_matcher import (
+    convert_pdq_strings_to_ndarray,
+)
 from threatexchange.signal_type.pdq.pdq_utils import BITS_IN_PDQ
 import typing as t
 import numpy
-import binascii
 
 
 class VPDQHashIndex:
@@ -25,9 +27,7 @@ class VPDQHashIndex:
         Args:
             hashes : One video's VPDQ features of to create the index with
         """
-        hash_bytes = [binascii.unhexlify(h.pdq_hex) for h in hashes]
-        vectors = [numpy.frombuffer(h, dtype=numpy.uint8) for h in hash_bytes]
-        self.faiss_index.add(numpy.array(vectors))
+        self.faiss_index.add(convert_pdq_strings_to_ndarray(h.pdq_hex for h in hashes))
 
     def search_with_distance_in_result(
         self, queries: t.List[VpdqCompactFeature], distance_tolerance: int
@@ -56,25 +56,24 @@ class VPDQHashIndex:
             query_str =>  (idx, distance)
             result = {
                 "000000000000000000000000000000000000000000000000000000000000ffff": [
-                    (12345678901, 16.0)
+                    (12345678901, 16)
                 ]
             }
         """
 
-        query_vectors = [
-            numpy.frombuffer(binascii.unhexlify(q.pdq_hex), dtype=numpy.uint8)
-            for q in queries
-        ]
-        qs = numpy.array(query_vectors)
+        qs = convert_pdq_strings_to_ndarray(q.pdq_hex for q in queries)
         limits, similarities, neighbors = self.faiss_index.range_search(
             qs, distance_tolerance + 1
         )
 
+        ids = neighbors.tolist()
+        distances = similarities.astype(numpy.int32).tolist()
+        bounds = limits.tolist()
+
         result = {}
         for i, query in enumerate(queries):
-            matches = [idx.item() for idx in neighbors[limits[i] : limits[i + 1]]]
-            distances = [idx for idx in similarities[limits[i] : limits[i + 1]]]
-            result[query.pdq_hex] = list(zip(matches, distances))
+            start, end = bounds[i], bounds[i + 1]
+            result[query.pdq_hex] = list(zip(ids[start:end], distances[start:end]))
         return result
 
     def __getstate__(self):
@@ -6,7 +6,7 @@ import binascii
 import numpy
 from abc import ABC, abstractmethod
 
-from threatexchange.signal_type.pdq.pdq_utils import BITS_IN_PDQ
+from threatexchange.signal_type.pdq.pdq_utils import BITS_IN_PDQ, BYTES_IN_PDQ
 
 PDQ_HASH_TYPE = t.Union[str, bytes]
 
@@ -27,6 +27,23 @@ def int64_to_uint64(as_int64: int):
     return numpy.int64(as_int64).astype(numpy.uint64).item()
 
 
+def convert_pdq_strings_to_ndarray(hashes: t.Iterable[PDQ_HASH_TYPE]) -> numpy.ndarray:
+    """
+    Packs PDQ hex strings into a (N, 32) uint8 array, the layout expected by faiss binary indexes.
+
+    All hashes are decoded into a single buffer, so no intermediate ndarray is created per hash.
+    Raises ValueError if any hash does not decode to exactly BYTES_IN_PDQ bytes.
+    """
+    decoded = [binascii.unhexlify(h) for h in hashes]
+    for d in decoded:
+        if len(d) != BYTES_IN_PDQ:
+            raise ValueError(
+                f"PDQ hash must be {BYTES_IN_PDQ} bytes, got {len(d)}: {d.hex()}"
+            )
+    packed = b"".join(decoded)
+    return numpy.frombuffer(packed, dtype=numpy.uint8).reshape(-1, BYTES_IN_PDQ)
+
+
 class PDQHashIndex(ABC):
     @abstractmethod
     def __init__(self, faiss_index: faiss.IndexBinary) -> None:
@@ -41,12 +58,31 @@ class PDQHashIndex(ABC):
         """
         pass
 
-    @abstractmethod
     def add(self, hashes: t.Iterable[PDQ_HASH_TYPE], custom_ids: t.Iterable[int]):
         """
         Adds hashes and their custom ids to the PDQ index.
+
+        Parameters
+        ----------
+        hashes: sequence of PDQ Hashes
+            The PDQ hashes to create the index with
+        custom_ids: sequence of custom ids for the PDQ Hashes
+            Sequence of custom id values to use for the PDQ hashes for any
+            method relating to indexes (e.g., hash_at). If provided, the nth item in
+            custom_ids will be used as the id for the nth hash in hashes. If not provided
+            then the ids for the hashes will be assumed to be their respective index
+            in hashes (i.e., the nth hash would have id n, starting from 0).
         """
-        pass
+        vectors = convert_pdq_strings_to_ndarray(hashes)
+        i64_ids = list(map(uint64_to_int64, custom_ids))
+        self._add_with_ids(vectors, i64_ids)
+
+    def _add_with_ids(self, vectors: numpy.ndarray, i64_ids: t.List[int]) -> None:
+        """
+        Adds packed hashes to the underlying faiss index. Subclasses that keep
+        their own bookkeeping alongside faiss can extend this.
+        """
+        self.faiss_index.add_with_ids(vectors, numpy.array(i64_ids))
 
     def search(
         self,
@@ -82,30 +118,24 @@ class PDQHashIndex(ABC):
             "0000000000000000000000000000000000000000000000000000000000000000" for a threshold of 16. Thus it would appear in
             the entry for both the hashes if they were both in the queries list.
         """
-        query_vectors = [
-            numpy.frombuffer(binascii.unhexlify(q), dtype=numpy.uint8) for q in queries
-        ]
-        qs = numpy.array(query_vectors)
+        qs = convert_pdq_strings_to_ndarray(queries)
         limits, _, I = self.faiss_index.range_search(qs, threshhold + 1)
 
-        if return_as_ids:
-            # for custom ids, we understood them initially as uint64 numbers and then coerced them internally to be signed
-            # int64s, so we need to reverse this before returning them back to the caller. For non custom ids, this will
-            # effectively return the same result
-            output_fn: t.Callable[[int], t.Any] = int64_to_uint64
-        else:
-            output_fn = self.hash_at
+        # for custom ids, we understood them initially as uint64 numbers and then coerced them internally to be signed
+        # int64s, so we need to reverse this before returning them back to the caller. For non custom ids, this will
+        # effectively return the same result. Converting the whole array at once avoids a numpy scalar per match.
+        ids: t.List[t.Any] = I.view(numpy.uint64).tolist()
+        if not return_as_ids:
+            ids = [self.hash_at(idx) for idx in ids]
 
-        return [
-            [output_fn(idx.item()) for idx in I[limits[i] : limits[i + 1]]]
-            for i in range(len(query_vectors))
-        ]
+        bounds = limits.tolist()
+        return [ids[bounds[i] : bounds[i + 1]] for i in range(len(qs))]
 
     def search_with_distance_in_result(
         self,
         queries: t.Sequence[str],
         threshhold: int,
-    ) -> t.Dict[str, t.List[t.Tuple[int, str, numpy.float32]]]:
+    ) -> t.Dict[str, t.List[t.Tuple[int, str, int]]]:
         """
         Search method that return a mapping from query_str =>  (id, hash, distance)
 
@@ -115,31 +145,31 @@ class PDQHashIndex(ABC):
         e.g.
         result = {
             "000000000000000000000000000000000000000000000000000000000000FFFF": [
-                (12345678901, "00000000000000000000000000000000000000000000000000000000FFFFFFFF", 16.0)
+                (12345678901, "00000000000000000000000000000000000000000000000000000000FFFFFFFF", 16)
             ]
         }
         """
 
-        query_vectors = [
-            numpy.frombuffer(binascii.unhexlify(q), dtype=numpy.uint8) for q in queries
-        ]
-        qs = numpy.array(query_vectors)
+        qs = convert_pdq_strings_to_ndarray(queries)
         limits, similarities, I = self.faiss_index.range_search(qs, threshhold + 1)
 
         # for custom ids, we understood them initially as uint64 numbers and then coerced them internally to be signed
         # int64s, so we need to reverse this before returning them back to the caller. For non custom ids, this will
         # effectively return the same result
-        output_fn: t.Callable[[int], t.Any] = int64_to_uint64
+        ids = I.view(numpy.uint64).tolist()
+        # hamming distances are whole numbers, but depending on the faiss version
+        # binary range_search returns them as int32 or float32
+        distances = similarities.astype(numpy.int32).tolist()
+        bounds = limits.tolist()
 
         result = {}
         for i, query in enumerate(queries):
-            match_tuples = []
-            matches = [idx.item() for idx in I[limits[i] : limits[i + 1]]]
-            distances = [idx for idx in similarities[limits[i] : limits[i + 1]]]
-            for match, distance in zip(matches, distances):
-                # (Id, Hash, Distance)
-                match_tuples.append((output_fn(match), self.hash_at(match), distance))
-            result[query] = match_tuples
+            start, end = bounds[i], bounds[i + 1]
+            # (Id, Hash, Distance)
+            result[query] = [
+                (idx, self.hash_at(idx), distance)
+                for idx, distance in zip(ids[start:end], distances[start:end])
+            ]
         return result
 
     def __getstate__(self):
@@ -164,26 +194,6 @@ class PDQFlatHashIndex(PDQHashIndex):
         )
         super().__init__(faiss_index)
 
-    def add(self, hashes: t.Iterable[PDQ_HASH_TYPE], custom_ids: t.Iterable[int]):
-        """
-        Parameters
-        ----------
-        hashes: sequence of PDQ Hashes
-            The PDQ hashes to create the index with
-        custom_ids: sequence of custom ids for the PDQ Hashes
-            Sequence of custom id values to use for the PDQ hashes for any
-            method relating to indexes (e.g., hash_at). If provided, the nth item in
-            custom_ids will be used as the id for the nth hash in hashes. If not provided
-            then the ids for the hashes will be assumed to be their respective index
-            in hashes (i.e., the nth hash would have id n, starting from 0).
-        """
-        hash_bytes = [binascii.unhexlify(hash) for hash in hashes]
-        vectors = list(
-            map(lambda h: numpy.frombuffer(h, dtype=numpy.uint8), hash_bytes)
-        )
-        i64_ids = list(map(uint64_to_int64, custom_ids))
-        self.faiss_index.add_with_ids(numpy.array(vectors), numpy.array(i64_ids))
-
     def hash_at(self, idx: int) -> str:
         i64_id = uint64_to_int64(idx)
         vector = self.faiss_index.reconstruct(i64_id)
@@ -211,34 +221,15 @@ class PDQMultiHashIndex(PDQHashIndex):
         super().__init__(faiss_index)
         self.__construct_index_rev_map()
 
-    def add(
-        self,
-        hashes: t.Iterable[PDQ_HASH_TYPE],
-        custom_ids: t.Iterable[int],
-    ):
-        """
-        Parameters
-        ----------
-        hashes: sequence of PDQ Hashes
-            The PDQ hashes to create the index with
-        custom_ids: sequence of custom ids for the PDQ Hashes
-            Sequence of custom id values to use for the PDQ hashes for any
-            method relating to indexes (e.g., hash_at). If provided, the nth item in
-            custom_ids will be used as the id for the nth hash in hashes. If not provided
-            then the ids for the hashes will be assumed to be their respective index
-            in hashes (i.e., the nth hash would have id n, starting from 0).
-
-        Returns
-        -------
-        a PDQMultiHashIndex of these hashes
-        """
-        hash_bytes = [binascii.unhexlify(hash) for hash in hashes]
-        vectors = list(
-            map(lambda h: numpy.frombuffer(h, dtype=numpy.uint8), hash_bytes)
-        )
-        i64_ids = list(map(uint64_to_int64, custom_ids))
-        self.faiss_index.add_with_ids(numpy.array(vectors), numpy.array(i64_ids))
-        self.__construct_index_rev_map()
+    def _add_with_ids(self, vectors: numpy.ndarray, i64_ids: t.List[int]) -> None:
+        start = self.faiss_index.ntotal
+        super()._add_with_ids(vectors, i64_ids)
+        # Extend the rev map with just the new ids instead of rebuilding it,
+        # which would make repeated single adds quadratic
+        if self.index_rev_map is not None:
+            self.index_rev_map.update(
+                zip(i64_ids, range(start, self.faiss_index.ntotal))
+            )
 
     @property
     def mih_index(self):
@@ -58,7 +58,7 @@ class PDQIndex(SignalTypeIndex[IndexT]):
         for id, _, distance in results[hash]:
             matches.append(
                 IndexMatchUntyped(
-                    SignalSimilarityInfoWithIntDistance(int(distance)),
+                    SignalSimilarityInfoWithIntDistance(distance),
                     self.local_id_to_entry[id][1],
                 )
             )
@@ -68,14 +68,16 @@ class PDQIndex(SignalTypeIndex[IndexT]):
         self.add_all(((signal_str, entry),))
 
     def add_all(self, entries: t.Iterable[t.Tuple[str, IndexT]]) -> None:
+        entries = list(entries)
+        if not entries:
+            return
         start = len(self.local_id_to_entry)
+        # This function signature is very silly
+        self.index.add(
+            [e[0] for e in entries],
+            range(start, start + len(entries)),
+        )
         self.local_id_to_entry.extend(entries)
-        if start != len(self.local_id_to_entry):
-            # This function signature is very silly
-            self.index.add(
-                (e[0] for e in self.local_id_to_entry[start:]),
-                range(start, len(self.local_id_to_entry)),
-            )
 
 
 class PDQFlatIndex(PDQIndex):
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 # Copyright (c) Meta Platforms, Inc. and affiliates.
 
+import binascii
+
 BITS_IN_PDQ = 256
 PDQ_HEX_STR_LEN = int(BITS_IN_PDQ / 4)
+BYTES_IN_PDQ = BITS_IN_PDQ // 8
 
 
 def simple_distance_binary(bin_a: str, bin_b: str) -> int:
@@ -18,7 +21,19 @@ def simple_distance(hex_a: str, hex_b: str) -> int:
     """
     Returns the binary hamming distance of two hexadecimal strings.
     """
-    return simple_distance_binary(hex_to_binary_str(hex_a), hex_to_binary_str(hex_b))
+    assert len(hex_a) == PDQ_HEX_STR_LEN
+    assert len(hex_b) == PDQ_HEX_STR_LEN
+    # XOR the hashes as ints and count set bits, rather than comparing
+    # 256 single-character strings
+    return bin(_hex_to_int(hex_a) ^ _hex_to_int(hex_b)).count("1")
+
+
+def _hex_to_int(pdq_hex: str) -> int:
+    """
+    Strictly decode a hexadecimal string. Unlike int(x, 16), rejects signs,
+    underscores, whitespace and a 0x prefix by raising ValueError.
+    """
+    return int.from_bytes(binascii.unhexlify(pdq_hex), "big")
 
 
 def hex_to_binary_str(pdq_hex: str) -> str:
@@ -26,8 +41,7 @@ def hex_to_binary_str(pdq_hex: str) -> str:
     Convert a hexadecimal string to a binary string. Requires input string to be length PDQ_HEX_STR_LEN.
     """
     assert len(pdq_hex) == PDQ_HEX_STR_LEN
-    # padding to 4 bindigits each hexdigit
-    result = "".join(bin(int(c, 16))[2:].zfill(4) for c in pdq_hex)
+    result = f"{_hex_to_int(pdq_hex):0{BITS_IN_PDQ}b}"
     assert len(result) == BITS_IN_PDQ
     return result
 
@@ -125,6 +125,25 @@ class TestPDQIndex(unittest.TestCase):
             ],
         )
 
+    def test_search_index_built_with_single_adds(self):
+        index: PDQIndex = PDQIndex()
+        for signal_str, entry in test_entries:
+            index.add(signal_str, entry)
+        assert len(index) == len(test_entries)
+
+        result = index.query(test_entries[1][0])
+        self.assertEqualPDQIndexMatchResults(
+            result,
+            [
+                PDQIndexMatch(
+                    SignalSimilarityInfoWithIntDistance(0), test_entries[1][1]
+                ),
+                PDQIndexMatch(
+                    SignalSimilarityInfoWithIntDistance(16), test_entries[0][1]
+                ),
+            ],
+        )
+
     def test_search_index_with_no_match(self):
         query_hash = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
         result = self.index.query(query_hash)
@@ -8,6 +8,7 @@ import numpy
 from threatexchange.signal_type.pdq.pdq_faiss_matcher import (
     PDQFlatHashIndex,
     PDQMultiHashIndex,
+    convert_pdq_strings_to_ndarray,
 )
 
 test_hashes = [
@@ -21,6 +22,29 @@ test_hashes = [
 MAX_UNSIGNED_INT64 = numpy.iinfo(numpy.int64).max
 
 
+class TestConvertPDQStringsToNdarray(unittest.TestCase):
+    def test_packs_hashes_into_rows(self):
+        vectors = convert_pdq_strings_to_ndarray(test_hashes)
+        assert vectors.shape == (len(test_hashes), 32)
+        assert vectors.dtype == numpy.uint8
+        for h, row in zip(test_hashes, vectors):
+            assert row.tobytes() == binascii.unhexlify(h)
+
+    def test_accepts_bytes_hashes(self):
+        vectors = convert_pdq_strings_to_ndarray([h.encode() for h in test_hashes])
+        assert vectors.tobytes() == b"".join(binascii.unhexlify(h) for h in test_hashes)
+
+    def test_empty(self):
+        assert convert_pdq_strings_to_ndarray([]).shape == (0, 32)
+
+    def test_rejects_wrong_length_hashes(self):
+        # Total length is 64 bytes, but neither hash is 32 bytes on its own
+        with self.assertRaises(ValueError):
+            convert_pdq_strings_to_ndarray(["00" * 31, "ff" * 33])
+        with self.assertRaises(ValueError):
+            convert_pdq_strings_to_ndarray(["00" * 31])
+
+
 class MixinTests:
     class PDQHashIndexCommonTests(unittest.TestCase):
         index = None
@@ -74,6 +98,14 @@ class MixinTests:
             result = self.index.search(query, 0)
             self.assertEqualPDQHashSearchResults(result, [[], [], [test_hashes[-1]]])
 
+        def test_search_with_distance_in_result(self):
+            query = test_hashes[0]
+            result = self.index.search_with_distance_in_result([query], 16)
+            distances = {h: d for _, h, d in result[query]}
+            self.assertEqual(distances, {test_hashes[0]: 0, test_hashes[1]: 16})
+            for d in distances.values():
+                self.assertIs(type(d), int)
+
         def test_supports_pickling(self):
             pickled_data = pickle.dumps(self.index)
             assert (
@@ -156,6 +188,13 @@ class TestPDQMultiHashIndex(MixinTests.PDQHashIndexCommonTests, unittest.TestCas
     def test_hash_at(self):
         assert test_hashes[2] == self.index.hash_at(2)
 
+    def test_hash_at_after_incremental_adds(self):
+        index = PDQMultiHashIndex()
+        for i, h in enumerate(test_hashes):
+            index.add([h], [i])
+        for i, h in enumerate(test_hashes):
+            assert h == index.hash_at(i)
+
     def test_search_index_return_ids(self):
         query = test_hashes[:2]
         results = self.index.search(query, 16, return_as_ids=True)
@@ -12,7 +12,6 @@ from threatexchange.tests.hashing.utils import (
     get_similar_hash,
 )
 
-
 test_hashes = [
     "0000000000000000000000000000000000000000000000000000000000000000",
     "0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f",
@@ -79,6 +78,28 @@ class TestPDQUtils(unittest.TestCase):
             simple_distance(test_hashes[1], test_hashes[3]), BITS_IN_PDQ // 2
         )
 
+    def test_distance_matches_binary_distance(self):
+        examples = PdqSignal.get_examples()
+        for a, b in zip(examples, examples[1:] + examples[:1]):
+            self.assertEqual(
+                simple_distance(a, b),
+                simple_distance_binary(hex_to_binary_str(a), hex_to_binary_str(b)),
+            )
+
+    def test_malformed_hex_raises(self):
+        for malformed in (
+            "-" + "f" * 63,
+            "0_" + "f" * 62,
+            " " + "f" * 63,
+            "0x" + "f" * 62,
+        ):
+            with self.assertRaises(ValueError):
+                simple_distance(malformed, test_hashes[0])
+            with self.assertRaises(ValueError):
+                simple_distance(test_hashes[0], malformed)
+            with self.assertRaises(ValueError):
+                hex_to_binary_str(malformed)
+
     def test_match_threshold(self):
         self.assertFalse(pdq_match(test_hashes[0], test_hashes[1], threshold=31))
         self.assertTrue(